@@ -0,0 +1,13 @@
+"""
+Application package.
+
+Motor sizes the thread pool it runs blocking PyMongo calls on from the
+MOTOR_MAX_WORKERS environment variable, read once at import time. Set it
+here - before any submodule imports motor - so the setting actually takes
+effect. An explicit MOTOR_MAX_WORKERS in the environment still wins.
+"""
+import os
+
+from app.config import get_settings
+
+os.environ.setdefault("MOTOR_MAX_WORKERS", str(get_settings().motor_max_workers))
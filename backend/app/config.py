@@ -20,6 +20,13 @@ class Settings(BaseSettings):
     # MongoDB
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_db_name: str = "federated_health_ai"
+    mongodb_max_pool_size: int = 200
+    mongodb_min_pool_size: int = 20
+    mongodb_wait_queue_timeout_ms: int = 2000
+    mongodb_server_selection_timeout_ms: int = 2000
+    # Size of motor's worker thread pool; applied in app/__init__.py because
+    # motor only reads MOTOR_MAX_WORKERS at import time.
+    motor_max_workers: int = 10
 
     # JWT
     jwt_secret_key: str = "your-secret-key-change-in-production"
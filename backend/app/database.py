@@ -1,6 +1,9 @@
 """
 Database connection and MongoDB client management.
 """
+import random
+from datetime import datetime
+
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from app.config import get_settings
 
@@ -16,11 +19,43 @@ database: AsyncIOMotorDatabase = None
 async def connect_to_mongo():
     """Connect to MongoDB."""
     global client, database
-    client = AsyncIOMotorClient(settings.mongodb_url)
+    client = AsyncIOMotorClient(
+        settings.mongodb_url,
+        maxPoolSize=settings.mongodb_max_pool_size,
+        minPoolSize=settings.mongodb_min_pool_size,
+        waitQueueTimeoutMS=settings.mongodb_wait_queue_timeout_ms,
+        serverSelectionTimeoutMS=settings.mongodb_server_selection_timeout_ms,
+    )
     database = client[settings.mongodb_db_name]
+    await ensure_indexes()
     print(f"Connected to MongoDB: {settings.mongodb_url}")
 
 
+async def ensure_indexes():
+    """Create the indexes backing the hot query predicates."""
+    await database.users.create_index([("email", 1)], unique=True)
+    await database.otps.create_index([("email", 1), ("otp_code", 1), ("used", 1)])
+    # TTL index: the server reaps expired OTPs (~every 60s), keeping the hot
+    # OTP index small instead of growing without bound.
+    await database.otps.create_index([("expires_at", 1)], expireAfterSeconds=0)
+    await database.password_resets.create_index([("email", 1), ("reset_code", 1), ("used", 1)])
+    await database.password_resets.create_index([("expires_at", 1)], expireAfterSeconds=0)
+    # Patient domain: every lookup filters on one of these id fields, and the
+    # list endpoints sort on the second key, so the indexes serve both the
+    # match and the sort.
+    await database.patients.create_index([("user_id", 1), ("is_active", 1)])
+    await database.patients.create_index([("patient_id", 1), ("is_active", 1)])
+    await database.medical_history.create_index([("patient_id", 1), ("diagnosis_date", -1)])
+    await database.medical_history.create_index([("patient_id", 1), ("created_at", -1)])
+    await database.allergies.create_index([("patient_id", 1), ("severity", -1)])
+    await database.insurance.create_index([("patient_id", 1)])
+    # The get_*_by_id lookups filter on these generated ids alone, which the
+    # patient_id-led compounds above cannot serve.
+    await database.medical_history.create_index([("history_id", 1)])
+    await database.allergies.create_index([("allergy_id", 1)])
+    await database.insurance.create_index([("insurance_id", 1)])
+
+
 async def close_mongo_connection():
     """Close MongoDB connection."""
     global client
@@ -29,6 +64,17 @@ async def close_mongo_connection():
         print("Closed MongoDB connection")
 
 
+def generate_id(prefix: str) -> str:
+    """Generate a prefixed unique ID (e.g. PT20240101120000001).
+
+    Purely client-side (timestamp + random suffix): safe to call on hot
+    insert paths because it never costs a database round-trip, and the
+    timestamp prefix keeps the ids roughly insertion-sorted.
+    """
+    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    return f"{prefix}{timestamp}{random.randint(0, 999):03d}"
+
+
 def get_database() -> AsyncIOMotorDatabase:
     """Get database instance."""
     return database
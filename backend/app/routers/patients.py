@@ -1,5 +1,5 @@
 """Patient management API endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials
 
 from app.auth import (
@@ -27,14 +27,26 @@ from app.database import db as database
 router = APIRouter(prefix="/api/patients", tags=["patients"])
 
 
+_patient_service: PatientService = None
+_health_score_service: HealthScoreService = None
+
+
 def get_patient_service() -> PatientService:
-    """Get patient service instance."""
-    return PatientService(database.get_db())
+    """Get patient service instance, reused across requests for the same database."""
+    global _patient_service
+    db = database.get_db()
+    if _patient_service is None or _patient_service.db is not db:
+        _patient_service = PatientService(db)
+    return _patient_service
 
 
 def get_health_score_service() -> HealthScoreService:
-    """Get health score service instance."""
-    return HealthScoreService(database.get_db())
+    """Get health score service instance, reused across requests for the same database."""
+    global _health_score_service
+    db = database.get_db()
+    if _health_score_service is None or _health_score_service.db is not db:
+        _health_score_service = HealthScoreService(db)
+    return _health_score_service
 
 
 async def optional_auth(
@@ -152,16 +164,18 @@ async def add_medical_history(
 
 @router.get("/medical-history", response_model=list)
 async def get_medical_history(
+    limit: int = Query(100, ge=1, le=1000),
     current_user: dict = Depends(get_current_user),
     service: PatientService = Depends(get_patient_service),
 ):
     """
-    Get complete medical history.
+    Get medical history.
 
-    Returns all medical history records for authenticated patient.
+    Returns medical history records for authenticated patient, most recent
+    first, capped at `limit` records.
     """
     try:
-        history = await service.get_medical_history(current_user["user_id"])
+        history = await service.get_medical_history(current_user["user_id"], limit=limit)
         return [MedicalHistoryResponse(**record) for record in history]
     except ValueError as e:
         raise HTTPException(
@@ -225,16 +239,17 @@ async def add_allergy(
 
 @router.get("/allergies", response_model=list)
 async def get_allergies(
+    limit: int = Query(100, ge=1, le=1000),
     current_user: dict = Depends(get_current_user),
     service: PatientService = Depends(get_patient_service),
 ):
     """
-    Get all patient allergies.
+    Get patient allergies.
 
-    Returns all allergy records sorted by severity.
+    Returns allergy records sorted by severity, capped at `limit` records.
     """
     try:
-        allergies = await service.get_allergies(current_user["user_id"])
+        allergies = await service.get_allergies(current_user["user_id"], limit=limit)
         return [AllergyResponse(**allergy) for allergy in allergies]
     except ValueError as e:
         raise HTTPException(
@@ -1,19 +1,50 @@
 """
 Authentication service for user registration, login, and token management.
 """
+import asyncio
+import hashlib
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from bson import ObjectId
+from bson.errors import InvalidId
 from fastapi import Depends
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
 
 from app.database import get_database
 from app.models.user import UserCreate, UserLogin
 from app.services.email_service import get_email_service
-from app.utils.jwt import create_access_token, create_refresh_token, verify_token
+from app.utils.jwt import create_access_token, create_token_pair, verify_token
 from app.utils.otp import generate_otp, get_otp_expiry, is_otp_expired
-from app.utils.password import hash_password, verify_password
+from app.utils.password import hash_password, password_needs_rehash, verify_password
+
+# Verified refresh-token payloads keyed by SHA-256 of the token. Signature
+# verification is CPU-bound, so a short-lived cache keeps the hot refresh path
+# cheap while bounding how long a revoked/expired token could still be
+# honored. Failures are never cached.
+_REFRESH_CACHE_TTL = 30.0
+_REFRESH_CACHE_MAX = 10000
+_refresh_cache: dict = {}
+
+# Strong references to in-flight background email sends so the tasks are not
+# garbage-collected before completion.
+_email_tasks: set = set()
+
+
+@lru_cache(maxsize=8192)
+def _to_object_id(user_id: str) -> Optional[ObjectId]:
+    """Parse a user-id string into an ObjectId, memoizing repeated parses.
+
+    The same JWT `sub` value is parsed on every authenticated request, so
+    caching the (immutable) result avoids re-running the hex decode.
+    """
+    try:
+        return ObjectId(user_id)
+    except (InvalidId, TypeError):
+        return None
 
 
 class AuthService:
@@ -26,15 +57,22 @@ class AuthService:
 
     async def register_user(self, user_data: UserCreate) -> dict:
         """Register a new user."""
-        # Check if user already exists
-        existing_user = await self.db.users.find_one({"email": user_data.email})
+        # Check if user already exists (projection-limited existence probe;
+        # the unique email index is the real guarantee)
+        existing_user = await self.db.users.find_one({"email": user_data.email}, {"_id": 1})
         if existing_user:
             raise ValueError("User with this email already exists")
 
+        # Hash on a worker thread: bcrypt is deliberately slow and would
+        # otherwise block the event loop for every other request.
+        password_hash = await asyncio.to_thread(hash_password, user_data.password)
+
+        now = datetime.utcnow()
+
         # Create user document
         user_dict = {
             "email": user_data.email,
-            "password_hash": hash_password(user_data.password),
+            "password_hash": password_hash,
             "full_name": user_data.full_name,
             "phone_number": user_data.phone_number,
             "date_of_birth": user_data.date_of_birth,
@@ -43,28 +81,38 @@ class AuthService:
             "user_type": "patient",  # Default user type
             "verification_status": "pending",
             "is_active": True,
-            "created_at": datetime.utcnow(),
+            "created_at": now,
             "updated_at": None,
             "deleted_at": None,
         }
 
-        result = await self.db.users.insert_one(user_dict)
-        user_id = str(result.inserted_id)
-
-        # Generate and store OTP
+        # Generate OTP up front so both inserts can run concurrently; the
+        # OTP doc is harmless without its user, so atomicity is not needed.
         otp_code = generate_otp()
-        await self.db.otps.insert_one(
-            {
-                "email": user_data.email,
-                "otp_code": otp_code,
-                "expires_at": get_otp_expiry(),
-                "created_at": datetime.utcnow(),
-                "used": False,
-            }
-        )
+        otp_dict = {
+            "email": user_data.email,
+            "otp_code": otp_code,
+            "expires_at": get_otp_expiry(),
+            "created_at": now,
+            "used": False,
+        }
 
-        # Send OTP email
-        await self.email_service.send_otp_email(user_data.email, otp_code)
+        try:
+            result, _ = await asyncio.gather(
+                self.db.users.insert_one(user_dict),
+                self.db.otps.insert_one(otp_dict),
+            )
+        except DuplicateKeyError:
+            # Concurrent registration raced past the probe; the unique email
+            # index rejected it at the server.
+            raise ValueError("User with this email already exists")
+        user_id = str(result.inserted_id)
+
+        # Send the OTP email in the background so the response does not wait
+        # on mail-provider latency.
+        task = asyncio.create_task(self.email_service.send_otp_email(user_data.email, otp_code))
+        _email_tasks.add(task)
+        task.add_done_callback(_email_tasks.discard)
 
         return {
             "user_id": user_id,
@@ -74,18 +122,26 @@ class AuthService:
 
     async def verify_otp(self, email: str, otp_code: str) -> dict:
         """Verify OTP code for email verification."""
-        # Find valid OTP
-        otp_record = await self.db.otps.find_one({"email": email, "otp_code": otp_code, "used": False})
+        # Atomically consume the OTP: the used False -> True transition in a
+        # single find_one_and_update means two concurrent verifies cannot
+        # both succeed on the same code.
+        otp_record = await self.db.otps.find_one_and_update(
+            {
+                "email": email,
+                "otp_code": otp_code,
+                "used": False,
+                "expires_at": {"$gt": datetime.utcnow()},
+            },
+            {"$set": {"used": True}},
+        )
 
         if not otp_record:
+            # Cold failure path: one extra read to distinguish expired from invalid
+            stale = await self.db.otps.find_one({"email": email, "otp_code": otp_code, "used": False})
+            if stale and is_otp_expired(stale["expires_at"]):
+                return {"verification_status": "failed", "message": "OTP code has expired"}
             return {"verification_status": "failed", "message": "Invalid OTP code"}
 
-        if is_otp_expired(otp_record["expires_at"]):
-            return {"verification_status": "failed", "message": "OTP code has expired"}
-
-        # Mark OTP as used
-        await self.db.otps.update_one({"_id": otp_record["_id"]}, {"$set": {"used": True}})
-
         # Update user verification status
         await self.db.users.update_one({"email": email}, {"$set": {"verification_status": "verified"}})
 
@@ -93,30 +149,42 @@ class AuthService:
 
     async def login_user(self, login_data: UserLogin) -> dict:
         """Authenticate user and return tokens."""
-        # Find user
-        user = await self.db.users.find_one({"email": login_data.email})
+        # Hot path: fold all account guards into the query filter and project
+        # only the fields the token needs, so a login is one small read.
+        user = await self.db.users.find_one(
+            {
+                "email": login_data.email,
+                "deleted_at": None,
+                "is_active": True,
+                "verification_status": "verified",
+            },
+            {"email": 1, "password_hash": 1, "user_type": 1},
+        )
         if not user:
-            raise ValueError("Invalid email or password")
-
-        if user.get("deleted_at"):
-            raise ValueError("Account has been deleted")
-
-        if not user.get("is_active", True):
-            raise ValueError("Account is inactive")
-
-        if user.get("verification_status") != "verified":
+            # Cold path: re-read without guards to report the specific reason
+            user = await self.db.users.find_one({"email": login_data.email})
+            if not user:
+                raise ValueError("Invalid email or password")
+            if user.get("deleted_at"):
+                raise ValueError("Account has been deleted")
+            if not user.get("is_active", True):
+                raise ValueError("Account is inactive")
             raise ValueError("Please verify your email before logging in")
 
-        # Verify password
-        if not verify_password(login_data.password, user["password_hash"]):
+        # Verify password off the event loop (password hashing is CPU-bound)
+        if not await asyncio.to_thread(verify_password, login_data.password, user["password_hash"]):
             raise ValueError("Invalid email or password")
 
+        # Transparently upgrade legacy bcrypt hashes to Argon2id on login
+        if password_needs_rehash(user["password_hash"]):
+            new_hash = await asyncio.to_thread(hash_password, login_data.password)
+            await self.db.users.update_one({"_id": user["_id"]}, {"$set": {"password_hash": new_hash}})
+
         # Create tokens
         user_id = str(user["_id"])
         token_data = {"sub": user_id, "email": user["email"], "user_type": user["user_type"]}
 
-        access_token = create_access_token(token_data)
-        refresh_token = create_refresh_token(token_data)
+        access_token, refresh_token = create_token_pair(token_data)
 
         return {
             "access_token": access_token,
@@ -127,9 +195,19 @@ class AuthService:
 
     async def refresh_token(self, refresh_token: str) -> dict:
         """Refresh access token using refresh token."""
-        payload = verify_token(refresh_token, "refresh")
-        if not payload:
-            raise ValueError("Invalid or expired refresh token")
+        cache_key = hashlib.sha256(refresh_token.encode()).digest()
+        cached = _refresh_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            payload = cached[1]
+        else:
+            payload = verify_token(refresh_token, "refresh")
+            if not payload:
+                raise ValueError("Invalid or expired refresh token")
+            ttl = min(_REFRESH_CACHE_TTL, payload["exp"] - time.time())
+            if ttl > 0:
+                if len(_refresh_cache) >= _REFRESH_CACHE_MAX:
+                    _refresh_cache.clear()
+                _refresh_cache[cache_key] = (time.monotonic() + ttl, payload)
 
         # Create new access token
         token_data = {
@@ -143,22 +221,30 @@ class AuthService:
 
     async def get_user_by_id(self, user_id: str) -> Optional[dict]:
         """Get user by ID."""
-        try:
-            user = await self.db.users.find_one({"_id": ObjectId(user_id), "deleted_at": None})
-            if user:
-                user["user_id"] = str(user.pop("_id"))
-            return user
-        except Exception:
+        oid = _to_object_id(user_id)
+        if oid is None:
             return None
+        # The hash never belongs in profile-style reads; excluding it also
+        # trims the BSON transferred on every authenticated request.
+        user = await self.db.users.find_one({"_id": oid, "deleted_at": None}, {"password_hash": 0})
+        if user:
+            user["user_id"] = str(user.pop("_id"))
+        return user
 
     async def get_user_by_email(self, email: str) -> Optional[dict]:
         """Get user by email."""
-        user = await self.db.users.find_one({"email": email, "deleted_at": None})
+        user = await self.db.users.find_one({"email": email, "deleted_at": None}, {"password_hash": 0})
         if user:
             user["user_id"] = str(user.pop("_id"))
         return user
 
 
+_auth_service: Optional[AuthService] = None
+
+
 def get_auth_service(db: AsyncIOMotorDatabase = Depends(get_database)) -> AuthService:
-    """Get auth service instance."""
-    return AuthService(db)
+    """Get auth service instance, reused across requests for the same database."""
+    global _auth_service
+    if _auth_service is None or _auth_service.db is not db:
+        _auth_service = AuthService(db)
+    return _auth_service
@@ -1,11 +1,15 @@
 """
 Email service for sending OTP and password reset emails.
 """
+import logging
+from collections import deque
 from typing import Dict, Any
 from app.config import get_settings
 
 settings = get_settings()
 
+logger = logging.getLogger(__name__)
+
 
 class EmailService:
     """Email service for sending notifications."""
@@ -13,7 +17,9 @@ class EmailService:
     def __init__(self):
         """Initialize email service."""
         self.mock_mode = settings.email_mock_mode
-        self.sent_emails: list[Dict[str, Any]] = []
+        # Bounded: the singleton lives for the whole process, so an unbounded
+        # list would grow with every registration. Old entries fall off.
+        self.sent_emails: deque[Dict[str, Any]] = deque(maxlen=1000)
 
     async def send_otp_email(self, email: str, otp_code: str) -> bool:
         """Send OTP verification email."""
@@ -43,11 +49,14 @@ class EmailService:
             "data": data,
         }
         self.sent_emails.append(email_log)
-        print(f"[MOCK EMAIL] {email_type} to {email}: {data}")
+        # %-style args: the message is only formatted if DEBUG is enabled,
+        # and logging writes are buffered rather than an unbuffered stdout
+        # flush per email.
+        logger.debug("[MOCK EMAIL] %s to %s: %s", email_type, email, data)
 
     def get_sent_emails(self) -> list[Dict[str, Any]]:
-        """Get all sent emails (for testing)."""
-        return self.sent_emails
+        """Get recent sent emails (for testing)."""
+        return list(self.sent_emails)
 
     def clear_sent_emails(self) -> None:
         """Clear sent emails history (for testing)."""
@@ -1,10 +1,20 @@
 """Health score calculation service."""
+import asyncio
+import re
 from typing import Dict, Any
 from datetime import datetime, timedelta
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.models.patient import HealthScoreResponse, HealthScoreComponents
 
+# Medication mentions are tallied in one pass per note. Word boundaries stop
+# "mg" matching inside words like "diagnosis" (which the old substring scan
+# over-counted); optional plural "s" keeps "pills"/"tablets" covered.
+_MEDICATION_RE = re.compile(
+    r"\b(?:medications?|medicines?|pills?|tablets?|drugs?|dosages?|prescriptions?|mg(?:/ml)?)\b",
+    re.IGNORECASE,
+)
+
 
 class HealthScoreService:
     """Service for calculating patient health scores."""
@@ -52,51 +62,57 @@ class HealthScoreService:
         count = await self.db.medical_history.count_documents({"patient_id": patient_id, "status": "active"})
         return count
 
-    async def _get_medications_count(self, patient_id: str) -> int:
-        """Get count of medications from treatment notes."""
-        # Parse treatment notes for medication mentions
-        history_records = await self.db.medical_history.find(
-            {"patient_id": patient_id, "status": "active"},
-            {"treatment_notes": 1},
-        ).to_list(length=None)
-
-        medication_keywords = [
-            "medication",
-            "medicine",
-            "pill",
-            "tablet",
-            "drug",
-            "dosage",
-            "prescription",
-            "mg",
-            "mg/ml",
-        ]
-
+    @staticmethod
+    def _count_medication_mentions(history_records) -> int:
+        """Estimate medication count from treatment notes of history records."""
         medication_count = 0
         for record in history_records:
             notes = record.get("treatment_notes", "")
             if notes:
                 # Count medication keyword mentions as a rough estimate
-                for keyword in medication_keywords:
-                    medication_count += notes.lower().count(keyword)
+                medication_count += len(_MEDICATION_RE.findall(notes))
 
         # Cap at a reasonable maximum
         return min(medication_count // 2, 10)  # Divide by 2 to avoid overcounting
 
+    async def _get_medications_count(self, patient_id: str) -> int:
+        """Get count of medications from treatment notes."""
+        history_records = await self.db.medical_history.find(
+            {"patient_id": patient_id, "status": "active"},
+            {"treatment_notes": 1},
+        ).to_list(length=None)
+        return self._count_medication_mentions(history_records)
+
+    async def _get_conditions_and_medications_count(self, patient_id: str) -> tuple:
+        """Get active-conditions and medication counts from one read.
+
+        Both metrics filter medical_history on the same {patient_id,
+        status: active} predicate, so fetching the matching records once
+        serves the conditions count (len) and the notes-based medication
+        estimate without a second query.
+        """
+        history_records = await self.db.medical_history.find(
+            {"patient_id": patient_id, "status": "active"},
+            {"treatment_notes": 1},
+        ).to_list(length=None)
+        return len(history_records), self._count_medication_mentions(history_records)
+
     async def _get_recent_appointments_count(self, patient_id: str) -> int:
         """Get count of appointments in last 3 months."""
         three_months_ago = datetime.utcnow() - timedelta(days=90)
 
         # In production, you'd query the appointments collection
-        # For now, we'll simulate with medical history entries
+        # For now, we'll simulate with medical history entries. The result is
+        # clamped to 5 anyway, so tell the server to stop counting there
+        # instead of scanning every matching record.
         count = await self.db.medical_history.count_documents(
             {
                 "patient_id": patient_id,
                 "created_at": {"$gte": three_months_ago},
-            }
+            },
+            limit=5,
         )
 
-        # Use a reasonable estimation for demo purposes
         return min(count, 5)
 
     async def calculate_health_score(self, patient_id: str, patient_data: Dict[str, Any]) -> HealthScoreResponse:
@@ -104,13 +120,15 @@ class HealthScoreService:
         # Get BMI
         bmi = self._calculate_bmi(patient_data.get("height_cm", 170), patient_data.get("weight_kg", 70))
 
-        # Get component scores
+        # Get component scores; the two reads are independent, so overlap
+        # their round-trips instead of awaiting them one by one.
         bmi_component = self._calculate_bmi_component(bmi)
-        active_conditions_count = await self._get_active_conditions_count(patient_id)
+        (active_conditions_count, medication_count), recent_appointments = await asyncio.gather(
+            self._get_conditions_and_medications_count(patient_id),
+            self._get_recent_appointments_count(patient_id),
+        )
         conditions_component = self._calculate_conditions_component(active_conditions_count)
-        medication_count = await self._get_medications_count(patient_id)
         medications_component = self._calculate_medications_component(medication_count)
-        recent_appointments = await self._get_recent_appointments_count(patient_id)
         appointments_component = self._calculate_appointments_component(recent_appointments)
 
         # Calculate weighted overall score
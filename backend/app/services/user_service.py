@@ -13,6 +13,35 @@ from app.models.user import UserUpdate
 from app.utils.password import verify_password
 
 
+def _oid(user_id: str) -> ObjectId:
+    """Validate and convert a user id string to an ObjectId.
+
+    Checking ObjectId.is_valid up front replaces the broad try/except that
+    used to wrap every query - which also swallowed genuine database errors
+    and re-raised them as "Invalid user ID".
+    """
+    if not ObjectId.is_valid(user_id):
+        raise ValueError("Invalid user ID")
+    return ObjectId(user_id)
+
+
+def _profile_response(user: dict) -> dict:
+    """Shape a user document into the profile response payload."""
+    return {
+        "user_id": str(user["_id"]),
+        "email": user["email"],
+        "full_name": user["full_name"],
+        "phone_number": user.get("phone_number"),
+        "date_of_birth": user.get("date_of_birth"),
+        "address": user.get("address"),
+        "profile_photo_url": user.get("profile_photo_url"),
+        "user_type": user["user_type"],
+        "verification_status": user["verification_status"],
+        "created_at": user["created_at"],
+        "updated_at": user.get("updated_at"),
+    }
+
+
 class UserService:
     """Service for user profile operations."""
 
@@ -22,129 +51,112 @@ class UserService:
 
     async def get_user_profile(self, user_id: str) -> dict:
         """Get user profile by ID."""
-        try:
-            user = await self.db.users.find_one({"_id": ObjectId(user_id), "deleted_at": None})
-            if not user:
-                raise ValueError("User not found")
-
-            # Return user data
-            return {
-                "user_id": str(user["_id"]),
-                "email": user["email"],
-                "full_name": user["full_name"],
-                "phone_number": user.get("phone_number"),
-                "date_of_birth": user.get("date_of_birth"),
-                "address": user.get("address"),
-                "profile_photo_url": user.get("profile_photo_url"),
-                "user_type": user["user_type"],
-                "verification_status": user["verification_status"],
-                "created_at": user["created_at"],
-                "updated_at": user.get("updated_at"),
-            }
-        except ValueError:
-            raise
-        except Exception:
-            raise ValueError("Invalid user ID")
+        # Fetch only the fields the profile payload echoes; in particular
+        # this keeps password_hash out of the wire transfer.
+        user = await self.db.users.find_one(
+            {"_id": _oid(user_id), "deleted_at": None},
+            {
+                "email": 1,
+                "full_name": 1,
+                "phone_number": 1,
+                "date_of_birth": 1,
+                "address": 1,
+                "profile_photo_url": 1,
+                "user_type": 1,
+                "verification_status": 1,
+                "created_at": 1,
+                "updated_at": 1,
+            },
+        )
+        if not user:
+            raise ValueError("User not found")
+
+        return _profile_response(user)
 
     async def update_user_profile(self, user_id: str, update_data: UserUpdate) -> dict:
         """Update user profile."""
-        try:
-            # Build update document with only provided fields
-            update_dict = {"updated_at": datetime.utcnow()}
-            if update_data.full_name is not None:
-                update_dict["full_name"] = update_data.full_name
-            if update_data.phone_number is not None:
-                update_dict["phone_number"] = update_data.phone_number
-            if update_data.address is not None:
-                update_dict["address"] = update_data.address
-
-            user = await self.db.users.find_one_and_update(
-                {"_id": ObjectId(user_id), "deleted_at": None},
-                {"$set": update_dict},
-                return_document=ReturnDocument.AFTER,
-            )
-
-            if not user:
-                raise ValueError("User not found")
-
-            return {
-                "user_id": str(user["_id"]),
-                "email": user["email"],
-                "full_name": user["full_name"],
-                "phone_number": user.get("phone_number"),
-                "date_of_birth": user.get("date_of_birth"),
-                "address": user.get("address"),
-                "profile_photo_url": user.get("profile_photo_url"),
-                "user_type": user["user_type"],
-                "verification_status": user["verification_status"],
-                "created_at": user["created_at"],
-                "updated_at": user["updated_at"],
-            }
-        except ValueError:
-            raise
-        except Exception:
-            raise ValueError("Invalid user ID")
+        # Build update document with only provided fields
+        update_dict = {"updated_at": datetime.utcnow()}
+        if update_data.full_name is not None:
+            update_dict["full_name"] = update_data.full_name
+        if update_data.phone_number is not None:
+            update_dict["phone_number"] = update_data.phone_number
+        if update_data.address is not None:
+            update_dict["address"] = update_data.address
+
+        user = await self.db.users.find_one_and_update(
+            {"_id": _oid(user_id), "deleted_at": None},
+            {"$set": update_dict},
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if not user:
+            raise ValueError("User not found")
+
+        return _profile_response(user)
 
     async def update_profile_photo(self, user_id: str, photo_url: str) -> dict:
         """Update user profile photo."""
-        try:
-            user = await self.db.users.find_one_and_update(
-                {"_id": ObjectId(user_id), "deleted_at": None},
-                {
-                    "$set": {
-                        "profile_photo_url": photo_url,
-                        "updated_at": datetime.utcnow(),
-                    }
-                },
-                return_document=ReturnDocument.AFTER,
-            )
-
-            if not user:
-                raise ValueError("User not found")
-
-            return {
-                "photo_url": user.get("profile_photo_url"),
-                "upload_status": "success",
-            }
-        except ValueError:
-            raise
-        except Exception:
-            raise ValueError("Invalid user ID")
+        # The response only echoes the URL we were given, so a plain
+        # update_one suffices - no need for find_one_and_update to ship
+        # the whole document back. update_user_profile keeps the
+        # returning variant because its response needs the full profile.
+        result = await self.db.users.update_one(
+            {"_id": _oid(user_id), "deleted_at": None},
+            {
+                "$set": {
+                    "profile_photo_url": photo_url,
+                    "updated_at": datetime.utcnow(),
+                }
+            },
+        )
+
+        if result.matched_count == 0:
+            raise ValueError("User not found")
+
+        return {
+            "photo_url": photo_url,
+            "upload_status": "success",
+        }
 
     async def soft_delete_user(self, user_id: str, password: str) -> dict:
         """Soft delete user account."""
-        try:
-            user = await self.db.users.find_one({"_id": ObjectId(user_id), "deleted_at": None})
-
-            if not user:
-                raise ValueError("User not found")
-
-            # Verify password before deletion
-            if not verify_password(password, user["password_hash"]):
-                raise ValueError("Invalid password")
-
-            # Soft delete by setting deleted_at
-            await self.db.users.update_one(
-                {"_id": ObjectId(user_id)},
-                {
-                    "$set": {
-                        "deleted_at": datetime.utcnow(),
-                        "is_active": False,
-                        "updated_at": datetime.utcnow(),
-                    }
-                },
-            )
-
-            return {
-                "deletion_status": "success",
-                "message": "Account deleted successfully",
-            }
-        except ValueError:
-            raise
-        except Exception:
-            raise ValueError("Invalid user ID")
+        oid = _oid(user_id)
+        user = await self.db.users.find_one({"_id": oid, "deleted_at": None})
+
+        if not user:
+            raise ValueError("User not found")
+
+        # Verify password before deletion
+        if not verify_password(password, user["password_hash"]):
+            raise ValueError("Invalid password")
+
+        # Soft delete by setting deleted_at; one timestamp so
+        # deleted_at and updated_at match exactly
+        now = datetime.utcnow()
+        await self.db.users.update_one(
+            {"_id": oid},
+            {
+                "$set": {
+                    "deleted_at": now,
+                    "is_active": False,
+                    "updated_at": now,
+                }
+            },
+        )
+
+        return {
+            "deletion_status": "success",
+            "message": "Account deleted successfully",
+        }
+
+
+_user_service: UserService = None
 
 
 def get_user_service(db: AsyncIOMotorDatabase = Depends(get_database)) -> UserService:
-    """Get user service instance."""
-    return UserService(db)
+    """Get user service instance, reused across requests for the same database."""
+    global _user_service
+    if _user_service is None or _user_service.db is not db:
+        _user_service = UserService(db)
+    return _user_service
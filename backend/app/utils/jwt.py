@@ -1,7 +1,9 @@
 """
 JWT token handling utilities.
 """
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 from jose import JWTError, jwt
@@ -31,15 +33,52 @@ def create_refresh_token(data: dict) -> str:
     return encoded_jwt
 
 
-def decode_token(token: str) -> Optional[dict]:
-    """Decode and validate JWT token."""
+def create_token_pair(data: dict) -> tuple:
+    """Create an access/refresh token pair from a single copy of the claims."""
+    now = datetime.utcnow()
+    to_encode = data.copy()
+    to_encode.update(
+        {"exp": now + timedelta(minutes=settings.access_token_expire_minutes), "type": "access"}
+    )
+    access_token = jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    to_encode.update({"exp": now + timedelta(days=settings.refresh_token_expire_days), "type": "refresh"})
+    refresh_token = jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return access_token, refresh_token
+
+
+@lru_cache(maxsize=8192)
+def _decode_verified(token: str) -> Optional[dict]:
+    """Signature-check and decode a token, cached by the raw token string.
+
+    The same access token arrives on every request for the life of its
+    session, and the HMAC verification is pure CPU on the hot path - so
+    cache the decode and leave expiry to the caller, which must be
+    re-checked per call rather than frozen at first sight.
+    """
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        return payload
+        return jwt.decode(
+            token,
+            settings.jwt_secret_key,
+            algorithms=[settings.jwt_algorithm],
+            options={"verify_exp": False},
+        )
     except JWTError:
         return None
 
 
+def decode_token(token: str) -> Optional[dict]:
+    """Decode and validate JWT token."""
+    payload = _decode_verified(token)
+    if payload is None:
+        return None
+    # Expiry is wall-clock-dependent, so it is checked on every call even
+    # when the decode itself came from the cache.
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        return None
+    return payload
+
+
 def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
     """Verify token and return payload if valid."""
     payload = decode_token(token)
@@ -1,7 +1,7 @@
 """
 OTP generation and verification utilities.
 """
-import random
+import secrets
 from datetime import datetime, timedelta
 
 from app.config import get_settings
@@ -10,8 +10,13 @@ settings = get_settings()
 
 
 def generate_otp() -> str:
-    """Generate a 6-digit OTP code."""
-    return "".join([str(random.randint(0, 9)) for _ in range(settings.otp_length)])
+    """Generate a 6-digit OTP code.
+
+    One CSPRNG draw formatted with leading zeros: random.randint is
+    guessable for a security code, and the per-digit loop it replaces
+    allocated a string per digit.
+    """
+    return f"{secrets.randbelow(10**settings.otp_length):0{settings.otp_length}d}"
 
 
 def is_otp_expired(expires_at: datetime) -> bool:
@@ -39,9 +39,9 @@ class MockAsyncCollection:
     def __init__(self, collection):
         self.collection = collection
 
-    async def find_one(self, query=None):
+    async def find_one(self, query=None, projection=None):
         if query:
-            return self.collection.find_one(query)
+            return self.collection.find_one(query, projection)
         return None
 
     async def find(self, query=None):
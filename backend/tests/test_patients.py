@@ -130,6 +130,32 @@ async def test_register_patient_success(mock_database):
     mock_database.patients.insert_one.assert_called_once()
 
 
+@pytest.mark.unit
+async def test_register_patient_does_not_reread_after_insert(mock_database):
+    """Test registration builds its response without re-reading the document."""
+    mock_database.patients.find_one = AsyncMock(return_value=None)
+    mock_database.patients.insert_one = AsyncMock()
+
+    service = PatientService(mock_database)
+    patient_data = PatientCreate(
+        user_id="user123",
+        date_of_birth="1990-01-01",
+        gender="male",
+        blood_type="O+",
+        height_cm=175.0,
+        weight_kg=70.0,
+        emergency_contact_name="Jane Doe",
+        emergency_contact_phone="1234567890",
+    )
+
+    result = await service.register_patient(patient_data)
+
+    # Exactly one read (the existence probe) and one write - no post-insert find
+    mock_database.patients.find_one.assert_called_once()
+    mock_database.patients.insert_one.assert_called_once()
+    assert result["patient_id"].startswith("PT")
+
+
 @pytest.mark.unit
 async def test_register_patient_duplicate_user(mock_database):
     """Test registering patient with existing user_id fails."""